@@ -1,48 +1,123 @@
 import json
 import argparse
 import csv
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_INT_RE = re.compile(r"\d+")
+
+# Bound once so the hot paths skip a LOAD_ATTR per call.
+_strptime = datetime.strptime
+_strftime = datetime.strftime
+_FMT_SECONDS = "%Y-%m-%dT%H:%M:%S"
+_FMT_MICROS = "%Y-%m-%dT%H:%M:%S.%f"
+
+def iter_issues(file):
+    if ijson is not None:
+        with open(file, "rb") as f:
+            yield from ijson.items(f, "issues.item")
+    else:
+        with open(file, "rb") as f:
+            data = _json.loads(f.read())
+        yield from data.get("issues", [])
+
+def iso_to_ddmmyyyy(date_str):
+    # The date part of a Jira timestamp is a fixed-width prefix, so the
+    # default output format can be produced by slicing, no parse or strftime.
+    if date_str and len(date_str) >= 10 and date_str[4] == "-":
+        return f"{date_str[8:10]}-{date_str[5:7]}-{date_str[0:4]}"
+    return ""
+
+@lru_cache(maxsize=8192)
 def get_date_obj(date_str):
     if not date_str:
         return None
+    normalized = date_str
+    if normalized.endswith("Z"):
+        normalized = normalized[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(normalized)
+        # Match the previous strptime behaviour, which compared wall-clock
+        # times with the UTC offset truncated away.
+        return dt.replace(tzinfo=None) if dt.tzinfo else dt
+    except ValueError:
+        pass
     try:
-        return datetime.strptime(date_str[:19], "%Y-%m-%dT%H:%M:%S")
+        return _strptime(date_str[:19], _FMT_SECONDS)
     except Exception:
         try:
-            return datetime.strptime(date_str[:23], "%Y-%m-%dT%H:%M:%S.%f")
+            return _strptime(date_str[:23], _FMT_MICROS)
         except Exception:
             return None
 
-def format_date(dt, date_format):
-    return dt.strftime(date_format) if dt else ""
-
 def extract_actual_commit_dates(sprints, changelog, issue_created_date):
     sprint_id_to_start = {s["id"]: get_date_obj(s.get("startDate")) for s in sprints if s.get("id") and s.get("startDate")}
     sprint_ids = set(sprint_id_to_start.keys())
 
-    commit_dates = []
-
-    if changelog:
-        for history in changelog.get("histories", []):
-            for item in history.get("items", []):
-                if item.get("field") == "Sprint":
-                    to_field = item.get("to")
-                    if to_field:
-                        to_ids = [int(x.strip()) for x in to_field.strip("[]").split(",") if x.strip().isdigit()]
-                    else:
-                        to_ids = []
-                    for sid in to_ids:
-                        if sid in sprint_ids:
-                            history_dt = get_date_obj(history.get("created"))
-                            if history_dt:
-                                commit_dates.append((sid, history_dt))
+    # Collect (sprint id, raw timestamp) pairs without parsing; the parse and
+    # min-reduction happen in bulk below.
+    commit_pairs = []
+
+    histories = changelog.get("histories", ()) if changelog else ()
+    for history in histories:
+        # Jira always emits "items", "field" and "created", so index directly
+        # and bind them once per history instead of calling .get per item.
+        items = history["items"]
+        created = history["created"]
+        for item in items:
+            if item["field"] != "Sprint":
+                continue
+            to_field = item.get("to")
+            if not to_field or not created:
+                continue
+            for x in _INT_RE.findall(to_field):
+                sid = int(x)
+                if sid in sprint_ids:
+                    commit_pairs.append((sid, created))
+
+    min_by_sid = None
+    if np is not None and commit_pairs:
+        try:
+            sids = np.array([sid for sid, _ in commit_pairs])
+            # Truncate to wall-clock milliseconds, matching get_date_obj.
+            stamps = np.array([s[:23] for _, s in commit_pairs], dtype="datetime64[ms]")
+            min_by_sid = {
+                int(sid): stamps[sids == sid].min().astype("datetime64[us]").astype(datetime)
+                for sid in np.unique(sids)
+            }
+        except ValueError:
+            min_by_sid = None
+
+    if min_by_sid is None:
+        min_by_sid = {}
+        for sid, s in commit_pairs:
+            dt = get_date_obj(s)
+            if dt and (sid not in min_by_sid or dt < min_by_sid[sid]):
+                min_by_sid[sid] = dt
 
     result_dates = []
     for sid, start_date in sprint_id_to_start.items():
-        valid_commit_dates = [cd for s_id, cd in commit_dates if s_id == sid]
-        if valid_commit_dates:
-            result_dates.append(min(valid_commit_dates))
+        earliest = min_by_sid.get(sid)
+        if earliest:
+            result_dates.append(earliest)
         elif issue_created_date and start_date and issue_created_date > start_date:
             result_dates.append(issue_created_date)
         else:
@@ -52,15 +127,88 @@ def extract_actual_commit_dates(sprints, changelog, issue_created_date):
 
 def extract_status_dates(changelog):
     status_dates = {}
-    for history in changelog.get("histories", []):
-        for item in history.get("items", []):
-            if item.get("field") == "status":
-                status = item.get("toString")
-                date = get_date_obj(history.get("created"))
-                if status and date and status not in status_dates:
+    histories = changelog.get("histories", ()) if changelog else ()
+    for history in histories:
+        items = history["items"]
+        created = history["created"]
+        for item in items:
+            if item["field"] != "status":
+                continue
+            status = item.get("toString")
+            if status and status not in status_dates:
+                # A dump has ~10 distinct statuses but one fresh string per
+                # transition; intern so they share storage and compare fast.
+                status = sys.intern(status)
+                date = get_date_obj(created)
+                if date:
                     status_dates[status] = date
     return status_dates
 
+def process_file(file, omit_outside_sprint, sprint_keywords, date_format):
+    """Extract the issue rows for one input file. Top-level so it can be
+    shipped to a worker process."""
+    fmt_cache = {}
+    def format_date(dt):
+        return "" if dt is None else fmt_cache.setdefault(dt, _strftime(dt, date_format))
+
+    fast_ddmmyyyy = date_format == "%d-%m-%Y"
+
+    issue_data = []
+    statuses_seen = set()
+
+    for issue in iter_issues(file):
+        key = issue.get("key")
+        fields = issue.get("fields", {})
+
+        # Apply the cheap sprint filters before parsing any dates or walking
+        # the changelog, so filtered-out issues cost almost nothing.
+        # No consumer depends on sprint order: the commitment logic keys a
+        # dict by sprint id and the keyword filter uses any().
+        sprints = fields.get("customfield_10020") or []
+
+        if omit_outside_sprint and not sprints:
+            continue
+        if sprint_keywords:
+            names = [s.get("name", "").lower() for s in sprints]
+            if not any(keyword in name for keyword in sprint_keywords for name in names):
+                continue
+
+        changelog = issue.get("changelog", {})
+        issuetype = sys.intern(fields.get("issuetype", {}).get("name", ""))
+
+        created_raw = fields.get("created")
+        created_dt = get_date_obj(created_raw)
+        created_str = iso_to_ddmmyyyy(created_raw) if fast_ddmmyyyy else format_date(created_dt)
+        resolution_dt = get_date_obj(fields.get("resolutiondate"))
+
+        status_dates = extract_status_dates(changelog)
+        commit_dates = extract_actual_commit_dates(sprints, changelog, created_dt)
+        commitment_date = min(commit_dates, default=None)
+
+        # If any status transition date is before the start of the sprint, use the earliest of those as commitment
+        if commitment_date is not None:
+            commitment_date = min(
+                (d for d in status_dates.values() if d and d < commitment_date),
+                default=commitment_date,
+            )
+
+        candidates = [d for d in (commitment_date, status_dates.get("New"), status_dates.get("To Do")) if d]
+        commitment_date = max(candidates) if candidates else None
+
+        if resolution_dt and commitment_date and resolution_dt < commitment_date:
+            continue
+
+        statuses_seen.update(status_dates)
+        issue_data.append({
+            "key": key,
+            "issuetype": issuetype,
+            "created": created_str,
+            "commitment_date": format_date(commitment_date),
+            "statuses": status_dates
+        })
+
+    return issue_data, statuses_seen
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("input_files", nargs="+")
@@ -70,72 +218,70 @@ def main():
     parser.add_argument("--date-format", default="%d-%m-%Y")
     args = parser.parse_args()
 
-    issue_data = []
-
-    for file in args.input_files:
-        with open(file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        for issue in data.get("issues", []):
-            key = issue.get("key")
-            fields = issue.get("fields", {})
-            changelog = issue.get("changelog", {})
-            issuetype = fields.get("issuetype", {}).get("name", "")
-
-            created_dt = get_date_obj(fields.get("created"))
-            created_str = format_date(created_dt, args.date_format)
-            resolution_dt = get_date_obj(fields.get("resolutiondate"))
-
-            sprints = sorted(fields.get("customfield_10020") or [], key=lambda s: s.get("startDate") or "", reverse=False)
+    # The date format is constant for a run, so cache formatted strings on the
+    # datetime alone; the same few dates recur across many cells.
+    fmt = args.date_format
+    fmt_cache = {}
+    def format_date(dt):
+        return "" if dt is None else fmt_cache.setdefault(dt, _strftime(dt, fmt))
 
-            if args.omit_outside_sprint and not sprints:
-                continue
-            if args.sprint_keyword and not any(
-                any(keyword in s.get("name", "") for keyword in args.sprint_keyword) for s in sprints
-            ):
-                continue
+    # Lowercase the keywords once so the per-issue filter is case-insensitive
+    # without re-lowering the keyword list for every sprint.
+    sprint_keywords = [k.lower() for k in args.sprint_keyword] if args.sprint_keyword else None
 
-            status_dates = extract_status_dates(changelog)
-            commit_dates = extract_actual_commit_dates(sprints, changelog, created_dt)
-            commitment_date = min(commit_dates) if commit_dates else None
-            
-            # If any status transition date is before the start of the sprint, use the earliest of those as commitment
-            if commit_dates:
-                sprint_start = min(commit_dates)
-                early_status_dates = [dt for dt in status_dates.values() if dt and dt < sprint_start]
-                if early_status_dates:
-                    commitment_date = min(early_status_dates)
-
-            new_dt = status_dates.get("New")
-            todo_dt = status_dates.get("To Do")
-            candidates = [d for d in [commitment_date, new_dt, todo_dt] if d]
-            commitment_date = max(candidates) if candidates else None
-
-            if resolution_dt and commitment_date and resolution_dt < commitment_date:
-                continue
+    issue_data = []
+    all_statuses_set = set()
 
-            issue_data.append({
-                "key": key,
-                "issuetype": issuetype,
-                "created": created_str,
-                "commitment_date": format_date(commitment_date, args.date_format),
-                "statuses": status_dates
-            })
+    if len(args.input_files) > 1:
+        # Each file's parse and scan is CPU-bound and independent, so fan the
+        # files out across cores; ex.map preserves input-file order.
+        worker = partial(
+            process_file,
+            omit_outside_sprint=args.omit_outside_sprint,
+            sprint_keywords=sprint_keywords,
+            date_format=fmt,
+        )
+        with ProcessPoolExecutor() as ex:
+            for file_data, file_statuses in ex.map(worker, args.input_files):
+                issue_data.extend(file_data)
+                all_statuses_set.update(file_statuses)
+    else:
+        issue_data, all_statuses_set = process_file(args.input_files[0], args.omit_outside_sprint, sprint_keywords, fmt)
 
-    all_statuses = sorted({status for item in issue_data for status in item["statuses"]})
+    all_statuses = sorted(all_statuses_set)
     header = ["Issue Key", "issue type", "Backlog", "To Do"] + all_statuses
 
-    with open(args.output_file, "w", newline="", encoding="utf-8") as f:
+    # Convert each issue's status dict into a tuple aligned with the status
+    # columns, so the writer loop is a plain concat with no per-column lookups
+    # and the per-issue dicts can be collected.
+    status_to_col = {status: i for i, status in enumerate(all_statuses)}
+    for item in issue_data:
+        row_statuses = [""] * len(all_statuses)
+        for status, dt in item["statuses"].items():
+            row_statuses[status_to_col[status]] = format_date(dt)
+        item["statuses"] = tuple(row_statuses)
+
+    with open(args.output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        # csv.writer handles quoting for the header; the row cells are issue
+        # keys, issue types and formatted dates, none of which need quoting,
+        # so join them by hand. \r\n matches the csv module's terminator.
         writer = csv.writer(f)
         writer.writerow(header)
+        rows = []
         for item in issue_data:
-            row = [
-                item["key"],
+            rows.append(",".join((
+                item["key"] or "",
                 item["issuetype"],
                 item["created"],
                 item["commitment_date"]
-            ] + [format_date(item["statuses"].get(status), args.date_format) for status in all_statuses]
-            writer.writerow(row)
+            ) + item["statuses"]))
+            if len(rows) >= 4096:
+                f.write("\r\n".join(rows))
+                f.write("\r\n")
+                rows.clear()
+        if rows:
+            f.write("\r\n".join(rows))
+            f.write("\r\n")
 
 if __name__ == "__main__":
     main()